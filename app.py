@@ -1,22 +1,58 @@
-from flask import Flask, request, jsonify, render_template_string, redirect, url_for
+from flask import Flask, request, jsonify, render_template, redirect, url_for, stream_template, abort
+from flask.json.provider import JSONProvider
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup, escape
+import gzip
+import hashlib
+import os
 import sqlite3
+import threading
+import queue
+import time
+import zlib
 from datetime import datetime, date
+from itertools import combinations
 import json
 
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON; stdlib works without it
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is the universal fallback
+    brotli = None
+
+# The only legal transaction types; a frozenset membership test is the
+# cheapest way to reject bad input before it reaches the database
+_TYPES = frozenset(('income', 'expense'))
+
 # Transaction class using OOP
 class Transaction:
+    # Slots drop the per-instance __dict__ (~100 bytes each) and make
+    # attribute access a fixed-offset load, which matters when a page of
+    # rows is materialized per request
+    __slots__ = ('id', 'type', 'amount', 'category', 'description', 'date', 'created_at',
+                 '_dict_cache')
+
     def __init__(self, id=None, type="expense", amount=0.0, category="", description="", date=None, created_at=None):
+        if type not in _TYPES:
+            raise ValueError(f"type must be 'income' or 'expense', got {type!r}")
         self.id = id
-        self.type = type  # 'income' or 'expense'
+        self.type = type
         self.amount = float(amount)
         self.category = category
         self.description = description
         self.date = date or datetime.now().date().isoformat()
         self.created_at = created_at or datetime.now().isoformat()
+        self._dict_cache = None
     
     def to_dict(self):
         """Convert transaction object to dictionary for JSON serialization"""
-        return {
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             'id': self.id,
             'type': self.type,
             'amount': self.amount,
@@ -25,6 +61,7 @@ class Transaction:
             'date': self.date,
             'created_at': self.created_at
         }
+        return self._dict_cache
     
     @classmethod
     def from_dict(cls, data):
@@ -38,17 +75,99 @@ class Transaction:
             date=data.get('date'),
             created_at=data.get('created_at')
         )
+    
+    @classmethod
+    def _from_row(cls, row):
+        """Create Transaction from a database row, bypassing __init__.
+
+        Rows always carry every column with the right types (amount is a
+        REAL), so the default expressions and float() coercion in
+        __init__ are dead weight when loading many rows.
+        """
+        transaction = object.__new__(cls)
+        transaction.id = row['id']
+        transaction.type = row['type']
+        transaction.amount = row['amount']
+        transaction.category = row['category']
+        transaction.description = row['description']
+        transaction.date = row['date']
+        transaction.created_at = row['created_at']
+        transaction._dict_cache = None
+        return transaction
+
+# Columns the edit path may change. With only five of them there are just
+# 31 possible field subsets, so every UPDATE statement variant is built
+# once here and update_transaction does a dict lookup instead of string
+# assembly per request.
+UPDATE_FIELDS = ('type', 'amount', 'category', 'description', 'date')
+UPDATE_SQL = {
+    subset: ('UPDATE transactions SET ' + ', '.join(f'{f} = ?' for f in subset)
+             + ' WHERE id = ? '
+             'RETURNING id, type, amount, category, description, date, created_at')
+    for r in range(1, len(UPDATE_FIELDS) + 1)
+    for subset in combinations(UPDATE_FIELDS, r)
+}
+
+class _WriteOp:
+    """A write operation queued for the dedicated writer thread"""
+    __slots__ = ('func', 'standalone', 'result', 'error', 'done')
+
+    def __init__(self, func, standalone=False):
+        self.func = func
+        # standalone ops (ANALYZE, wal_checkpoint) run outside the batch
+        # transaction: checkpointing is a no-op inside one
+        self.standalone = standalone
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
 
 # Database management functions
 class ExpenseDatabase:
+    # Shared by the single-row and bulk insert paths so the driver's
+    # per-connection statement cache always gets an exact SQL match and
+    # skips re-preparing the statement.
+    _INSERT_SQL = '''
+        INSERT INTO transactions (type, amount, category, description, date, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+
+    _SELECT_BY_ID_SQL = 'SELECT * FROM transactions WHERE id = ?'
+    _DELETE_SQL = 'DELETE FROM transactions WHERE id = ?'
+
+    # Refresh planner statistics after this many mutated rows
+    OPTIMIZE_INTERVAL = 1000
+
     def __init__(self, db_name='expenses.db'):
         self.db_name = db_name
+        # Connections are kept open for the lifetime of the app: one reader
+        # per thread (SQLite's page cache stays warm across requests) and a
+        # single writer thread that owns the only write connection, since
+        # SQLite only allows one writer at a time anyway. Funnelling writes
+        # through a queue avoids lock contention between request threads and
+        # lets concurrent writes share one commit.
+        self._local = threading.local()
+        self._write_queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        # Memoized aggregation results, invalidated on every mutation so
+        # dashboard reads between mutations skip the summary queries.
+        self._cache = {}
+        self._cache_ttl = 60
+        self._mutations_since_optimize = 0
         self.init_db()
+        self._writer.start()
     
     def init_db(self):
         """Initialize the database and create transactions table"""
         conn = sqlite3.connect(self.db_name)
         cursor = conn.cursor()
+        # WAL avoids the per-commit fsync of the default rollback journal and
+        # lets dashboard reads proceed alongside a writer. journal_mode is
+        # persistent per DB file, so setting it once here is enough.
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('PRAGMA cache_size=-65536')
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS transactions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -60,175 +179,389 @@ class ExpenseDatabase:
                 created_at TEXT NOT NULL
             )
         ''')
+        # Indexes for the two hot query shapes: the recent-transactions list
+        # (ORDER BY date, created_at with LIMIT becomes an index walk that
+        # stops early) and type/category grouping (index scan, no sort).
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tx_date_created
+            ON transactions(date DESC, created_at DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tx_type_category
+            ON transactions(type, category)
+        ''')
+        # Running totals kept in sync by triggers, so get_summary and
+        # get_category_summary read a handful of rows instead of scanning
+        # and re-grouping the whole transactions table on every request.
+        cursor.executescript('''
+            CREATE TABLE IF NOT EXISTS summary (
+                type TEXT PRIMARY KEY,
+                total REAL NOT NULL DEFAULT 0,
+                count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS category_summary (
+                type TEXT NOT NULL,
+                category TEXT NOT NULL,
+                total REAL NOT NULL DEFAULT 0,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (type, category)
+            );
+            CREATE TRIGGER IF NOT EXISTS transactions_summary_insert
+            AFTER INSERT ON transactions BEGIN
+                INSERT INTO summary (type, total, count)
+                VALUES (NEW.type, NEW.amount, 1)
+                ON CONFLICT(type) DO UPDATE SET
+                    total = total + NEW.amount, count = count + 1;
+                INSERT INTO category_summary (type, category, total, count)
+                VALUES (NEW.type, NEW.category, NEW.amount, 1)
+                ON CONFLICT(type, category) DO UPDATE SET
+                    total = total + NEW.amount, count = count + 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS transactions_summary_delete
+            AFTER DELETE ON transactions BEGIN
+                UPDATE summary SET total = total - OLD.amount, count = count - 1
+                WHERE type = OLD.type;
+                UPDATE category_summary SET total = total - OLD.amount, count = count - 1
+                WHERE type = OLD.type AND category = OLD.category;
+            END;
+            CREATE TRIGGER IF NOT EXISTS transactions_summary_update
+            AFTER UPDATE ON transactions BEGIN
+                UPDATE summary SET total = total - OLD.amount, count = count - 1
+                WHERE type = OLD.type;
+                UPDATE category_summary SET total = total - OLD.amount, count = count - 1
+                WHERE type = OLD.type AND category = OLD.category;
+                INSERT INTO summary (type, total, count)
+                VALUES (NEW.type, NEW.amount, 1)
+                ON CONFLICT(type) DO UPDATE SET
+                    total = total + NEW.amount, count = count + 1;
+                INSERT INTO category_summary (type, category, total, count)
+                VALUES (NEW.type, NEW.category, NEW.amount, 1)
+                ON CONFLICT(type, category) DO UPDATE SET
+                    total = total + NEW.amount, count = count + 1;
+            END;
+        ''')
+        # Rebuild the running totals from the source table so databases
+        # created before the triggers existed start out consistent.
+        cursor.executescript('''
+            DELETE FROM summary;
+            INSERT INTO summary (type, total, count)
+                SELECT type, SUM(amount), COUNT(*) FROM transactions GROUP BY type;
+            DELETE FROM category_summary;
+            INSERT INTO category_summary (type, category, total, count)
+                SELECT type, category, SUM(amount), COUNT(*) FROM transactions
+                GROUP BY type, category;
+        ''')
         conn.commit()
+        # Refresh stale planner statistics from previous runs so the
+        # indexes above actually get picked
+        cursor.execute('PRAGMA optimize')
         conn.close()
     
-    def get_connection(self):
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_name)
+    def _new_connection(self):
+        """Open and configure a new database connection"""
+        conn = sqlite3.connect(self.db_name, check_same_thread=False,
+                               cached_statements=256)
         conn.row_factory = sqlite3.Row
+        # synchronous and cache_size are per-connection, unlike journal_mode
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA cache_size=-65536')
+        # wait instead of raising SQLITE_BUSY when another thread is writing
+        conn.execute('PRAGMA busy_timeout=5000')
         return conn
-    
-    def get_all_transactions(self, limit=None):
-        """Get all transactions from database"""
+
+    def get_connection(self):
+        """Get this thread's persistent read connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._new_connection()
+            self._local.conn = conn
+        return conn
+
+    def _writer_loop(self):
+        """Run queued write operations on the single write connection.
+
+        Whatever is already waiting in the queue is drained and committed
+        as one transaction, so concurrent writes from request threads
+        share a single fsync instead of queueing up on the file lock.
+        """
+        conn = self._new_connection()
+        while True:
+            op = self._write_queue.get()
+            if op.standalone:
+                # maintenance work runs alone, in autocommit, so it never
+                # rides inside (or rolls back) a batch of real writes
+                try:
+                    op.result = op.func(conn)
+                except Exception as e:
+                    op.error = e
+                op.done.set()
+                continue
+            ops = [op]
+            while len(ops) < 64:
+                try:
+                    nxt = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt.standalone:
+                    # push it back for the next iteration; the current
+                    # batch commits first
+                    self._write_queue.put(nxt)
+                    break
+                ops.append(nxt)
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                for op in ops:
+                    try:
+                        op.result = op.func(conn)
+                    except Exception as e:
+                        op.error = e
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                for op in ops:
+                    op.error = op.error or e
+            for op in ops:
+                op.done.set()
+
+    def _submit_write(self, func, timeout=30.0, standalone=False):
+        """Queue a write for the writer thread and wait for its result"""
+        op = _WriteOp(func, standalone=standalone)
+        self._write_queue.put(op)
+        if not op.done.wait(timeout):
+            raise TimeoutError('database writer did not respond within %.0fs' % timeout)
+        if op.error:
+            raise op.error
+        return op.result
+
+    def _cache_get(self, key):
+        """Return a cached value if present and not expired"""
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(self, key, value):
+        """Store a value in the cache with the configured TTL"""
+        self._cache[key] = (time.monotonic() + self._cache_ttl, value)
+        return value
+
+    def _invalidate_cache(self):
+        """Drop all cached results after a mutation"""
+        self._cache.clear()
+
+    def _after_mutation(self, count=1):
+        """Invalidate caches and periodically refresh planner statistics"""
+        self._invalidate_cache()
+        self._mutations_since_optimize += count
+        if self._mutations_since_optimize >= self.OPTIMIZE_INTERVAL:
+            self._mutations_since_optimize = 0
+            self.optimize()
+
+    def optimize(self):
+        """Truncate the WAL and refresh the query planner's statistics.
+
+        Runs automatically every OPTIMIZE_INTERVAL mutated rows; cheap
+        enough to also call explicitly after large imports. Routed through
+        the writer thread so only the write connection ever checkpoints or
+        analyzes - running it on a request thread's read connection would
+        contend with in-flight write batches.
+        """
+        def work(conn):
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            conn.execute('ANALYZE')
+            conn.execute('PRAGMA optimize')
+        self._submit_write(work, standalone=True)
+
+    def get_all_transactions_raw(self, limit=None):
+        """Iterate transactions as sqlite3.Row objects, newest first.
+
+        Returns the cursor itself rather than fetchall(), so rows are
+        pulled from SQLite on demand and a large result set is never
+        materialized unless the caller builds a list.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         
         query = 'SELECT * FROM transactions ORDER BY date DESC, created_at DESC'
         if limit:
-            query += f' LIMIT {limit}'
-            
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        conn.close()
+            cursor.execute(query + ' LIMIT ?', (limit,))
+        else:
+            cursor.execute(query)
+        return cursor
+
+    def get_page(self, size=10, after_id=None):
+        """Get a page of transactions using keyset pagination.
+
+        Filtering on id < after_id keeps the cost at O(size) no matter
+        how deep the caller pages, unlike OFFSET which walks and discards
+        every skipped row.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
         
-        transactions = []
-        for row in rows:
-            transaction = Transaction(
-                id=row['id'],
-                type=row['type'],
-                amount=row['amount'],
-                category=row['category'],
-                description=row['description'],
-                date=row['date'],
-                created_at=row['created_at']
-            )
-            transactions.append(transaction)
-        return transactions
+        if after_id is not None:
+            cursor.execute('''
+                SELECT * FROM transactions WHERE id < ?
+                ORDER BY id DESC LIMIT ?
+            ''', (after_id, size))
+        else:
+            cursor.execute('SELECT * FROM transactions ORDER BY id DESC LIMIT ?',
+                           (size,))
+        return cursor.fetchall()
+
+    def get_all_transactions_dicts(self, limit=None):
+        """Get all transactions as plain dicts, newest first"""
+        return [dict(row) for row in self.get_all_transactions_raw(limit)]
+
+    def get_all_transactions(self, limit=None):
+        """Get all transactions from database"""
+        return [Transaction._from_row(row) for row in self.get_all_transactions_raw(limit)]
     
-    def get_transaction_by_id(self, transaction_id):
-        """Get a specific transaction by ID"""
-        conn = self.get_connection()
+    def get_transaction_by_id(self, transaction_id, conn=None):
+        """Get a specific transaction by ID, optionally on a given connection"""
+        if conn is None:
+            conn = self.get_connection()
         cursor = conn.cursor()
-        cursor.execute('SELECT * FROM transactions WHERE id = ?', (transaction_id,))
+        cursor.execute(self._SELECT_BY_ID_SQL, (transaction_id,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
-            return Transaction(
-                id=row['id'],
-                type=row['type'],
-                amount=row['amount'],
-                category=row['category'],
-                description=row['description'],
-                date=row['date'],
-                created_at=row['created_at']
-            )
+            return Transaction._from_row(row)
         return None
     
     def add_transaction(self, transaction):
         """Add a new transaction to database"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO transactions (type, amount, category, description, date, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (transaction.type, transaction.amount, transaction.category, 
-              transaction.description, transaction.date, transaction.created_at))
-        transaction_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        def insert(conn):
+            cursor = conn.cursor()
+            cursor.execute(self._INSERT_SQL,
+                           (transaction.type, transaction.amount, transaction.category, 
+                            transaction.description, transaction.date, transaction.created_at))
+            return cursor.lastrowid
+        
+        transaction_id = self._submit_write(insert)
+        self._after_mutation()
         
         transaction.id = transaction_id
+        transaction._dict_cache = None
         return transaction
-    
+
+    def add_transactions_bulk(self, transactions):
+        """Add many transactions in a single database transaction.
+
+        Committing per row costs one fsync each; wrapping the whole batch
+        in BEGIN IMMEDIATE/COMMIT pays that cost once regardless of size.
+        """
+        rows = [(t.type, t.amount, t.category, t.description, t.date, t.created_at)
+                for t in transactions]
+        
+        def insert_all(conn):
+            conn.cursor().executemany(self._INSERT_SQL, rows)
+            return len(rows)
+        
+        count = self._submit_write(insert_all)
+        self._after_mutation(count)
+        return count
+
     def update_transaction(self, transaction_id, transaction_data):
         """Update an existing transaction"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        fields = []
-        values = []
-        
-        allowed_fields = ['type', 'amount', 'category', 'description', 'date']
-        for field in allowed_fields:
-            if field in transaction_data:
-                fields.append(f'{field} = ?')
-                values.append(transaction_data[field])
+        fields = tuple(f for f in UPDATE_FIELDS if f in transaction_data)
         
         if not fields:
             return None
         
+        values = [transaction_data[f] for f in fields]
         values.append(transaction_id)
-        query = f"UPDATE transactions SET {', '.join(fields)} WHERE id = ?"
+        # Precompiled statement; RETURNING hands back the updated row in
+        # the same round-trip
+        query = UPDATE_SQL[fields]
         
-        cursor.execute(query, values)
-        conn.commit()
+        def update(conn):
+            cursor = conn.cursor()
+            cursor.execute(query, values)
+            return cursor.fetchone()
         
-        if cursor.rowcount > 0:
-            updated_transaction = self.get_transaction_by_id(transaction_id)
-            conn.close()
-            return updated_transaction
+        row = self._submit_write(update)
+        self._after_mutation()
+        
+        if row:
+            return Transaction._from_row(row)
         
-        conn.close()
         return None
     
+    def update_transaction_full(self, transaction_id, type, amount, category,
+                                description, date):
+        """Update every editable column of a transaction in one statement.
+
+        Fast path for the edit form, which always posts all five fields:
+        values bind as one positional tuple with no field-subset dict and
+        no intermediate Transaction construction.
+        """
+        def update(conn):
+            cursor = conn.cursor()
+            cursor.execute(UPDATE_SQL[UPDATE_FIELDS],
+                           (type, amount, category, description, date, transaction_id))
+            return cursor.fetchone()
+        
+        row = self._submit_write(update)
+        self._after_mutation()
+        return row is not None
+
     def delete_transaction(self, transaction_id):
         """Delete a transaction from database"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM transactions WHERE id = ?', (transaction_id,))
-        deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        def delete(conn):
+            cursor = conn.cursor()
+            cursor.execute(self._DELETE_SQL, (transaction_id,))
+            return cursor.rowcount > 0
+        
+        deleted = self._submit_write(delete)
+        self._after_mutation()
         return deleted
     
     def get_summary(self):
         """Get financial summary"""
+        cached = self._cache_get('summary')
+        if cached is not None:
+            return cached
+        
         conn = self.get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute('''
+        # One statement, one round-trip: conditional aggregates pivot both
+        # summary rows into a single result row, so no per-row branching
+        # is needed in Python
+        row = conn.execute('''
             SELECT 
-                type,
-                SUM(amount) as total,
-                COUNT(*) as count
-            FROM transactions 
-            GROUP BY type
-        ''')
-        
-        results = cursor.fetchall()
+                COALESCE(SUM(CASE WHEN type = 'income' THEN total END), 0) AS total_income,
+                COALESCE(SUM(CASE WHEN type = 'expense' THEN total END), 0) AS total_expenses,
+                COALESCE(SUM(CASE WHEN type = 'income' THEN count END), 0) AS income_count,
+                COALESCE(SUM(CASE WHEN type = 'expense' THEN count END), 0) AS expense_count
+            FROM summary
+        ''').fetchone()
         
         summary = {
-            'total_income': 0.0,
-            'total_expenses': 0.0,
-            'net_balance': 0.0,
-            'income_count': 0,
-            'expense_count': 0,
-            'total_transactions': 0
+            'total_income': row['total_income'],
+            'total_expenses': row['total_expenses'],
+            'net_balance': row['total_income'] - row['total_expenses'],
+            'income_count': row['income_count'],
+            'expense_count': row['expense_count'],
+            'total_transactions': row['income_count'] + row['expense_count']
         }
         
-        for row in results:
-            if row['type'] == 'income':
-                summary['total_income'] = row['total']
-                summary['income_count'] = row['count']
-            elif row['type'] == 'expense':
-                summary['total_expenses'] = row['total']
-                summary['expense_count'] = row['count']
-        
-        summary['net_balance'] = summary['total_income'] - summary['total_expenses']
-        summary['total_transactions'] = summary['income_count'] + summary['expense_count']
-        
-        conn.close()
-        return summary
+        return self._cache_put('summary', summary)
     
     def get_category_summary(self):
         """Get summary by category"""
+        cached = self._cache_get('category_summary')
+        if cached is not None:
+            return cached
+        
         conn = self.get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT 
-                type,
-                category,
-                SUM(amount) as total,
-                COUNT(*) as count
-            FROM transactions 
-            GROUP BY type, category
+        results = conn.execute('''
+            SELECT type, category, total, count
+            FROM category_summary
+            WHERE count > 0
             ORDER BY total DESC
-        ''')
-        
-        results = cursor.fetchall()
+        ''').fetchall()
         
         categories = {
             'income': [],
@@ -242,11 +575,45 @@ class ExpenseDatabase:
                 'count': row['count']
             })
         
-        conn.close()
-        return categories
+        return self._cache_put('category_summary', categories)
 
 # Flask application
 app = Flask(__name__)
+# The stylesheets are immutable between deploys; let browsers cache them
+# for a month instead of re-downloading ~10KB of CSS per page view
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 2592000
+# Form posts here are a handful of small fields; cap the body size so
+# crafted requests can't tie up Werkzeug's form parser
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024
+# Templates only change on deploy: skip the per-render stat() for
+# modification checks and keep every compiled template cached
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.cache_size = 400
+# Persist compiled template bytecode across restarts so templates are
+# parsed once per deploy, not once per process. The default (no
+# directory argument) puts cache files in a per-uid directory and
+# verifies its ownership and mode - never point this at a fixed path in
+# a shared tempdir, since the cache is loaded with marshal and a
+# planted cache file would execute arbitrary code.
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+# Compile the page templates once at import; every render_template call
+# afterwards is a pure cache hit on the compiled Template objects
+app.jinja_env.get_template('main.html')
+app.jinja_env.get_template('edit.html')
+if orjson is not None:
+    class OrJSONProvider(JSONProvider):
+        """JSON provider backed by orjson, so jsonify and request.get_json
+        use the C encoder everywhere instead of the stdlib one"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrJSONProvider(app)
+
 db = ExpenseDatabase()
 
 # Predefined categories
@@ -261,823 +628,223 @@ INCOME_CATEGORIES = [
     'Rental Income', 'Gift', 'Bonus', 'Other'
 ]
 
-# HTML Templates
-MAIN_TEMPLATE = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Personal Expense Tracker</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        
-        .header {
-            text-align: center;
-            color: white;
-            margin-bottom: 30px;
-        }
-        
-        .header h1 {
-            font-size: 3em;
-            margin-bottom: 10px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        
-        .header p {
-            font-size: 1.2em;
-            opacity: 0.9;
-        }
-        
-        .dashboard {
-            display: grid;
-            grid-template-columns: 1fr 1fr 1fr;
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-        
-        .stat-card {
-            background: white;
-            border-radius: 15px;
-            padding: 25px;
-            text-align: center;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            transition: transform 0.3s;
-        }
-        
-        .stat-card:hover {
-            transform: translateY(-5px);
-        }
-        
-        .stat-card.income {
-            border-left: 5px solid #28a745;
-        }
-        
-        .stat-card.expense {
-            border-left: 5px solid #dc3545;
-        }
-        
-        .stat-card.balance {
-            border-left: 5px solid #007bff;
-        }
-        
-        .stat-card h3 {
-            color: #666;
-            font-size: 1em;
-            margin-bottom: 10px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-        
-        .stat-card .amount {
-            font-size: 2.5em;
-            font-weight: bold;
-            margin-bottom: 5px;
-        }
-        
-        .stat-card.income .amount {
-            color: #28a745;
-        }
-        
-        .stat-card.expense .amount {
-            color: #dc3545;
-        }
-        
-        .stat-card.balance .amount {
-            color: #007bff;
-        }
-        
-        .stat-card .count {
-            color: #999;
-            font-size: 0.9em;
-        }
-        
-        .main-content {
-            display: grid;
-            grid-template-columns: 1fr 2fr;
-            gap: 30px;
-        }
-        
-        .form-section {
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            height: fit-content;
-        }
-        
-        .form-section h2 {
-            color: #333;
-            margin-bottom: 25px;
-            text-align: center;
-        }
-        
-        .form-tabs {
-            display: flex;
-            margin-bottom: 25px;
-            border-radius: 10px;
-            overflow: hidden;
-            background: #f8f9fa;
-        }
-        
-        .tab-button {
-            flex: 1;
-            padding: 15px;
-            border: none;
-            background: #f8f9fa;
-            cursor: pointer;
-            font-weight: 600;
-            transition: all 0.3s;
-        }
-        
-        .tab-button.active {
-            background: #007bff;
-            color: white;
-        }
-        
-        .tab-button.income.active {
-            background: #28a745;
-        }
-        
-        .tab-button.expense.active {
-            background: #dc3545;
-        }
-        
-        .form-group {
-            margin-bottom: 20px;
-        }
-        
-        .form-group label {
-            display: block;
-            margin-bottom: 8px;
-            font-weight: 600;
-            color: #333;
-        }
-        
-        .form-group input, .form-group select, .form-group textarea {
-            width: 100%;
-            padding: 12px;
-            border: 2px solid #e9ecef;
-            border-radius: 8px;
-            font-size: 16px;
-            transition: border-color 0.3s;
-        }
-        
-        .form-group input:focus, .form-group select:focus, .form-group textarea:focus {
-            outline: none;
-            border-color: #007bff;
-        }
-        
-        .btn {
-            width: 100%;
-            padding: 15px;
-            border: none;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 16px;
-            font-weight: 600;
-            transition: all 0.3s;
-        }
-        
-        .btn-income {
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-            color: white;
-        }
-        
-        .btn-expense {
-            background: linear-gradient(135deg, #dc3545 0%, #fd7e14 100%);
-            color: white;
-        }
-        
-        .btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-        }
-        
-        .transactions-section {
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-        }
-        
-        .transactions-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 25px;
-        }
-        
-        .transactions-header h2 {
-            color: #333;
-        }
-        
-        .transaction-item {
-            display: flex;
-            align-items: center;
-            padding: 20px;
-            border: 2px solid #f8f9fa;
-            border-radius: 10px;
-            margin-bottom: 15px;
-            transition: all 0.3s;
-        }
-        
-        .transaction-item:hover {
-            border-color: #007bff;
-            transform: translateX(5px);
-        }
-        
-        .transaction-icon {
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin-right: 15px;
-            font-size: 1.5em;
-            font-weight: bold;
-        }
-        
-        .transaction-icon.income {
-            background: #d4edda;
-            color: #28a745;
-        }
-        
-        .transaction-icon.expense {
-            background: #f8d7da;
-            color: #dc3545;
-        }
-        
-        .transaction-details {
-            flex: 1;
-        }
-        
-        .transaction-details h4 {
-            color: #333;
-            margin-bottom: 5px;
-        }
-        
-        .transaction-details p {
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 3px;
-        }
-        
-        .transaction-amount {
-            font-size: 1.5em;
-            font-weight: bold;
-            margin-right: 15px;
-        }
-        
-        .transaction-amount.income {
-            color: #28a745;
-        }
-        
-        .transaction-amount.expense {
-            color: #dc3545;
-        }
-        
-        .transaction-actions {
-            display: flex;
-            gap: 10px;
-        }
-        
-        .btn-small {
-            padding: 6px 12px;
-            font-size: 12px;
-            border-radius: 6px;
-            text-decoration: none;
-            border: none;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .btn-edit {
-            background: #ffc107;
-            color: #212529;
-        }
-        
-        .btn-delete {
-            background: #dc3545;
-            color: white;
-        }
-        
-        .btn-small:hover {
-            transform: translateY(-1px);
-        }
-        
-        .no-transactions {
-            text-align: center;
-            padding: 60px 20px;
-            color: #666;
-        }
-        
-        .no-transactions h3 {
-            font-size: 1.5em;
-            margin-bottom: 10px;
-        }
-        
-        .category-chips {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-top: 20px;
-        }
-        
-        .category-chip {
-            background: #e9ecef;
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-size: 0.9em;
-            color: #666;
-        }
-        
-        .category-chip.income {
-            background: #d4edda;
-            color: #28a745;
-        }
-        
-        .category-chip.expense {
-            background: #f8d7da;
-            color: #dc3545;
-        }
-        
-        .hidden {
-            display: none;
-        }
-        
-        @media (max-width: 768px) {
-            .dashboard {
-                grid-template-columns: 1fr;
-            }
-            
-            .main-content {
-                grid-template-columns: 1fr;
-            }
-            
-            .header h1 {
-                font-size: 2em;
-            }
-            
-            .stat-card .amount {
-                font-size: 2em;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>💰 Personal Expense Tracker</h1>
-            <p>Track your income and expenses, stay in control of your finances!</p>
-        </div>
-        
-        <div class="dashboard">
-            <div class="stat-card income">
-                <h3>Total Income</h3>
-                <div class="amount">₹{{ "%.2f"|format(summary.total_income) }}</div>
-                <div class="count">{{ summary.income_count }} transactions</div>
-            </div>
-            
-            <div class="stat-card expense">
-                <h3>Total Expenses</h3>
-                <div class="amount">₹{{ "%.2f"|format(summary.total_expenses) }}</div>
-                <div class="count">{{ summary.expense_count }} transactions</div>
-            </div>
-            
-            <div class="stat-card balance">
-                <h3>Net Balance</h3>
-                <div class="amount">₹{{ "%.2f"|format(summary.net_balance) }}</div>
-                <div class="count">{{ summary.total_transactions }} total</div>
-            </div>
-        </div>
-        
-        <div class="main-content">
-            <div class="form-section">
-                <h2>Add Transaction</h2>
-                
-                <div class="form-tabs">
-                    <button class="tab-button income active" onclick="switchTab('income')">
-                        + Income
-                    </button>
-                    <button class="tab-button expense" onclick="switchTab('expense')">
-                        - Expense
-                    </button>
-                </div>
-                
-                <form method="POST" action="/add" id="transactionForm">
-                    <input type="hidden" name="type" id="transactionType" value="income">
-                    
-                    <div class="form-group">
-                        <label for="amount">Amount (₹)</label>
-                        <input type="number" id="amount" name="amount" step="0.01" min="0" required>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label for="category">Category</label>
-                        <select id="category" name="category" required>
-                            <option value="">Select category...</option>
-                        </select>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label for="description">Description</label>
-                        <textarea id="description" name="description" rows="3" placeholder="Optional description..."></textarea>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label for="date">Date</label>
-                        <input type="date" id="date" name="date" value="{{ today }}" required>
-                    </div>
-                    
-                    <button type="submit" class="btn btn-income" id="submitBtn">
-                        💰 Add Income
-                    </button>
-                </form>
-                
-                <div class="category-chips">
-                    <h4 style="width: 100%; margin-bottom: 10px;">Popular Categories:</h4>
-                    <div id="incomeChips" class="category-chips">
-                        {% for cat in income_categories[:6] %}
-                        <span class="category-chip income">{{ cat }}</span>
-                        {% endfor %}
-                    </div>
-                    <div id="expenseChips" class="category-chips hidden">
-                        {% for cat in expense_categories[:6] %}
-                        <span class="category-chip expense">{{ cat }}</span>
-                        {% endfor %}
-                    </div>
-                </div>
-            </div>
-            
-            <div class="transactions-section">
-                <div class="transactions-header">
-                    <h2>Recent Transactions</h2>
-                    <span style="color: #666;">{{ transactions|length }} transactions</span>
-                </div>
-                
-                {% if transactions %}
-                    {% for transaction in transactions %}
+# The category names are fixed plain text, so mark them escape-safe once
+# and Jinja skips the character-by-character escape scan every time the
+# edit form renders its option lists. User-supplied values are never
+# wrapped like this and still escape normally.
+EXPENSE_CATEGORIES = [Markup(cat) for cat in EXPENSE_CATEGORIES]
+INCOME_CATEGORIES = [Markup(cat) for cat in INCOME_CATEGORIES]
+
+# The category lists are module constants, so their chip markup and JSON
+# script literals are rendered once here instead of looping through Jinja
+# and re-serializing on every request
+INCOME_CHIPS_HTML = Markup(''.join(
+    f'<span class="category-chip income">{escape(cat)}</span>'
+    for cat in INCOME_CATEGORIES[:6]
+))
+EXPENSE_CHIPS_HTML = Markup(''.join(
+    f'<span class="category-chip expense">{escape(cat)}</span>'
+    for cat in EXPENSE_CATEGORIES[:6]
+))
+INCOME_CATEGORIES_JSON = Markup(json.dumps(INCOME_CATEGORIES))
+EXPENSE_CATEGORIES_JSON = Markup(json.dumps(EXPENSE_CATEGORIES))
+
+# Mimetypes worth compressing; images and the like are already compressed
+COMPRESSIBLE_MIMETYPES = ('text/html', 'text/css', 'application/json',
+                          'application/javascript', 'text/plain')
+
+# Large response bodies here are mostly constant between requests (the
+# edit-page shell, cached API JSON), so compressed output is memoized by
+# content hash instead of being recompressed per request
+_compress_cache = {}
+_COMPRESS_CACHE_MAX = 64
+
+def _compressed(data, encoding):
+    """Compress data with the given encoding, memoized by content hash"""
+    key = (encoding, hashlib.blake2b(data, digest_size=16).digest())
+    cached = _compress_cache.get(key)
+    if cached is None:
+        if len(_compress_cache) >= _COMPRESS_CACHE_MAX:
+            _compress_cache.clear()
+        if encoding == 'br':
+            cached = brotli.compress(data, quality=5)
+        else:
+            cached = gzip.compress(data, 6)
+        _compress_cache[key] = cached
+    return cached
+
+def _gzip_stream(chunks):
+    """Gzip a streamed response chunk by chunk without buffering it"""
+    # wbits=31 makes zlib emit gzip framing (header + CRC trailer)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+@app.after_request
+def compress_response(response):
+    """Compress responses for clients that accept it.
+
+    The rendered pages are highly compressible text; compression cuts
+    bytes on the wire roughly 5-10x. Brotli is preferred when installed
+    (smaller output), gzip is the universal fallback. Streamed responses
+    (the dashboard) are gzipped incrementally so streaming and
+    compression are not traded off against each other.
+    """
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    accept_encoding = request.headers.get('Accept-Encoding', '').lower()
+
+    if response.is_streamed:
+        # chunks aren't known yet, so no size threshold or memoization;
+        # wrap the generator and compress as the page renders
+        if 'gzip' not in accept_encoding:
+            return response
+        response.response = _gzip_stream(response.response)
+        response.headers.pop('Content-Length', None)
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+    if brotli is not None and 'br' in accept_encoding:
+        encoding = 'br'
+    elif 'gzip' in accept_encoding:
+        encoding = 'gzip'
+    else:
+        return response
+
+    data = response.get_data()
+    if len(data) < 500:  # not worth the header overhead
+        return response
+
+    response.set_data(_compressed(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+# Per-row markup for the dashboard list, rendered with str.format instead
+# of Jinja's per-iteration interpreter; user-supplied fields are escaped
+# explicitly before substitution
+_ROW_HTML = '''
                     <div class="transaction-item">
-                        <div class="transaction-icon {{ transaction.type }}">
-                            {% if transaction.type == 'income' %}+{% else %}-{% endif %}
+                        <div class="transaction-icon {type}">
+                            {sign}
                         </div>
                         
                         <div class="transaction-details">
-                            <h4>{{ transaction.category }}</h4>
-                            <p>{{ transaction.description or 'No description' }}</p>
-                            <p><strong>{{ transaction.date }}</strong></p>
+                            <h4>{category}</h4>
+                            <p>{description}</p>
+                            <p><strong>{date}</strong></p>
                         </div>
                         
-                        <div class="transaction-amount {{ transaction.type }}">
-                            {% if transaction.type == 'income' %}+{% else %}-{% endif %}₹{{ "%.2f"|format(transaction.amount) }}
+                        <div class="transaction-amount {type}">
+                            {sign}₹{amount:.2f}
                         </div>
                         
                         <div class="transaction-actions">
-                            <a href="/edit/{{ transaction.id }}" class="btn-small btn-edit">Edit</a>
-                            <a href="/delete/{{ transaction.id }}" class="btn-small btn-delete" 
+                            <a href="/edit/{id}" class="btn-small btn-edit">Edit</a>
+                            <a href="/delete/{id}" class="btn-small btn-delete" 
                                onclick="return confirm('Are you sure you want to delete this transaction?')">Delete</a>
                         </div>
                     </div>
-                    {% endfor %}
-                {% else %}
-                    <div class="no-transactions">
-                        <h3>💸 No transactions yet!</h3>
-                        <p>Start by adding your first income or expense.</p>
-                    </div>
-                {% endif %}
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        const incomeCategories = {{ income_categories|tojson }};
-        const expenseCategories = {{ expense_categories|tojson }};
-        
-        function switchTab(type) {
-            document.querySelectorAll('.tab-button').forEach(btn => {
-                btn.classList.remove('active');
-            });
-            document.querySelector(`.tab-button.${type}`).classList.add('active');
-            
-            document.getElementById('transactionType').value = type;
-            
-            const categorySelect = document.getElementById('category');
-            categorySelect.innerHTML = '<option value="">Select category...</option>';
-            
-            const categories = type === 'income' ? incomeCategories : expenseCategories;
-            categories.forEach(cat => {
-                const option = document.createElement('option');
-                option.value = cat;
-                option.textContent = cat;
-                categorySelect.appendChild(option);
-            });
-            
-            const submitBtn = document.getElementById('submitBtn');
-            if (type === 'income') {
-                submitBtn.className = 'btn btn-income';
-                submitBtn.innerHTML = '💰 Add Income';
-            } else {
-                submitBtn.className = 'btn btn-expense';
-                submitBtn.innerHTML = '💸 Add Expense';
-            }
-            
-            document.getElementById('incomeChips').classList.toggle('hidden', type !== 'income');
-            document.getElementById('expenseChips').classList.toggle('hidden', type !== 'expense');
-        }
-        
-        switchTab('income');
-        
-        document.querySelectorAll('.category-chip').forEach(chip => {
-            chip.addEventListener('click', function() {
-                document.getElementById('category').value = this.textContent;
-            });
-        });
-    </script>
-</body>
-</html>
 '''
 
-EDIT_TEMPLATE = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Edit Transaction - Expense Tracker</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 600px;
-            margin: 50px auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }
-        
-        .header {
-            background: linear-gradient(135deg, #ff9a56 0%, #ff6b35 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }
-        
-        .header h1 {
-            font-size: 2em;
-            margin-bottom: 10px;
-        }
-        
-        .form-section {
-            padding: 40px;
-        }
-        
-        .transaction-type {
-            display: flex;
-            margin-bottom: 25px;
-            border-radius: 10px;
-            overflow: hidden;
-            background: #f8f9fa;
-        }
-        
-        .type-option {
-            flex: 1;
-            padding: 15px;
-            text-align: center;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-        
-        .type-option input {
-            margin-right: 8px;
-        }
-        
-        .type-option.income {
-            background: #d4edda;
-            color: #28a745;
-        }
-        
-        .type-option.expense {
-            background: #f8d7da;
-            color: #dc3545;
-        }
-        
-        .form-group {
-            margin-bottom: 25px;
-        }
-        
-        .form-group label {
-            display: block;
-            margin-bottom: 8px;
-            font-weight: 600;
-            color: #333;
-        }
-        
-        .form-group input, .form-group select, .form-group textarea {
-            width: 100%;
-            padding: 15px;
-            border: 2px solid #e9ecef;
-            border-radius: 8px;
-            font-size: 16px;
-            transition: border-color 0.3s;
-        }
-        
-        .form-group input:focus, .form-group select:focus, .form-group textarea:focus {
-            outline: none;
-            border-color: #ff6b35;
-        }
-        
-        .form-group textarea {
-            resize: vertical;
-            min-height: 100px;
-        }
-        
-        .button-group {
-            display: flex;
-            gap: 15px;
-            justify-content: center;
-        }
-        
-        .btn {
-            padding: 12px 30px;
-            border: none;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 16px;
-            font-weight: 600;
-            text-decoration: none;
-            display: inline-block;
-            transition: all 0.2s;
-        }
-        
-        .btn-primary {
-            background: linear-gradient(135deg, #ff6b35 0%, #ff9a56 100%);
-            color: white;
-        }
-        
-        .btn-primary:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(255, 107, 53, 0.4);
-        }
-        
-        .btn-secondary {
-            background: #6c757d;
-            color: white;
-        }
-        
-        .btn-secondary:hover {
-            background: #5a6268;
-            transform: translateY(-2px);
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>✏️ Edit Transaction</h1>
-            <p>Update your transaction details</p>
-        </div>
-        
-        <div class="form-section">
-            <form method="POST">
-                <div class="transaction-type">
-                    <label class="type-option income">
-                        <input type="radio" name="type" value="income" {% if transaction.type == 'income' %}checked{% endif %}>
-                        💰 Income
-                    </label>
-                    <label class="type-option expense">
-                        <input type="radio" name="type" value="expense" {% if transaction.type == 'expense' %}checked{% endif %}>
-                        💸 Expense
-                    </label>
-                </div>
-                
-                <div class="form-group">
-                    <label for="amount">Amount (₹)</label>
-                    <input type="number" id="amount" name="amount" step="0.01" min="0" 
-                           value="{{ transaction.amount }}" required>
-                </div>
-                
-                <div class="form-group">
-                    <label for="category">Category</label>
-                    <select id="category" name="category" required>
-                        <option value="">Select category...</option>
-                        {% if transaction.type == 'income' %}
-                            {% for cat in income_categories %}
-                                <option value="{{ cat }}" {% if cat == transaction.category %}selected{% endif %}>
-                                    {{ cat }}
-                                </option>
-                            {% endfor %}
-                        {% else %}
-                            {% for cat in expense_categories %}
-                                <option value="{{ cat }}" {% if cat == transaction.category %}selected{% endif %}>
-                                    {{ cat }}
-                                </option>
-                            {% endfor %}
-                        {% endif %}
-                    </select>
-                </div>
-                
-                <div class="form-group">
-                    <label for="description">Description</label>
-                    <textarea id="description" name="description" rows="3">{{ transaction.description }}</textarea>
-                </div>
-                
-                <div class="form-group">
-                    <label for="date">Date</label>
-                    <input type="date" id="date" name="date" value="{{ transaction.date }}" required>
-                </div>
-                
-                <div class="button-group">
-                    <button type="submit" class="btn btn-primary">💾 Update Transaction</button>
-                    <a href="{{ url_for('index') }}" class="btn btn-secondary">Cancel</a>
-                </div>
-            </form>
-        </div>
-    </div>
-    
-    <script>
-        const incomeCategories = {{ income_categories|tojson }};
-        const expenseCategories = {{ expense_categories|tojson }};
-        
-        document.querySelectorAll('input[name="type"]').forEach(radio => {
-            radio.addEventListener('change', function() {
-                const categorySelect = document.getElementById('category');
-                categorySelect.innerHTML = '<option value="">Select category...</option>';
-                
-                const categories = this.value === 'income' ? incomeCategories : expenseCategories;
-                categories.forEach(cat => {
-                    const option = document.createElement('option');
-                    option.value = cat;
-                    option.textContent = cat;
-                    categorySelect.appendChild(option);
-                });
-            });
-        });
-    </script>
-</body>
-</html>
-'''
+def _render_rows(transactions):
+    """Render the transaction list rows outside Jinja.
+
+    str.format on a constant template is several times faster than the
+    template engine's per-iteration rendering for rows this simple.
+    """
+    return Markup(''.join(
+        _ROW_HTML.format(
+            id=row['id'],
+            type=row['type'],
+            sign='+' if row['type'] == 'income' else '-',
+            category=escape(row['category']),
+            description=escape(row['description']) if row['description'] else 'No description',
+            date=escape(row['date']),
+            amount=row['amount']
+        )
+        for row in transactions
+    ))
+
+# date.today().isoformat() allocates a new string per dashboard render
+# but only changes once a day, so cache it keyed on the current date
+_TODAY_CACHE = {'day': None, 'iso': ''}
+
+def _today_iso():
+    """Return today's date in ISO format, cached per day"""
+    today = date.today()
+    if _TODAY_CACHE['day'] != today:
+        _TODAY_CACHE['day'] = today
+        # an ISO date is plain ASCII; pre-marking it skips Jinja's escape pass
+        _TODAY_CACHE['iso'] = Markup(today.isoformat())
+    return _TODAY_CACHE['iso']
+
+def _require_urlencoded_form():
+    """Reject form posts that aren't plain urlencoded bodies.
+
+    Parsing crafted multipart bodies is disproportionately expensive, and
+    the app's forms only ever submit urlencoded data.
+    """
+    content_type = request.headers.get('Content-Type', '').split(';', 1)[0].strip()
+    if content_type != 'application/x-www-form-urlencoded':
+        abort(415)
 
 # Routes
 @app.route('/')
 def index():
     """Render the main page with transactions and summary"""
-    transactions = db.get_all_transactions(limit=10)  # Show last 10 transactions
+    # clamp both ends: SQLite treats a negative LIMIT as "no limit"
+    size = max(1, min(request.args.get('size', 10, type=int) or 10, 100))
+    after_id = request.args.get('after', type=int)
+    
+    transactions = db.get_page(size=size, after_id=after_id)
+    # A full page means there may be older rows; expose the keyset cursor
+    next_after = transactions[-1]['id'] if len(transactions) == size else None
     summary = db.get_summary()
     
-    return render_template_string(
-        MAIN_TEMPLATE,
-        transactions=[t.to_dict() for t in transactions],
+    # Streaming sends the template's static shell chunks as Jinja emits
+    # them instead of buffering the whole ~20KB page, so the browser gets
+    # first bytes before the dynamic rows are even rendered
+    return stream_template(
+        'main.html',
+        rows_html=_render_rows(transactions),
         summary=summary,
-        income_categories=INCOME_CATEGORIES,
-        expense_categories=EXPENSE_CATEGORIES,
-        today=date.today().isoformat()
+        next_after=next_after,
+        size=size,
+        income_chips=INCOME_CHIPS_HTML,
+        expense_chips=EXPENSE_CHIPS_HTML,
+        income_categories_json=INCOME_CATEGORIES_JSON,
+        expense_categories_json=EXPENSE_CATEGORIES_JSON,
+        today=_today_iso()
     )
 
 @app.route('/add', methods=['POST'])
 def add_transaction():
     """Add a new transaction"""
+    _require_urlencoded_form()
     try:
-        data = request.form
+        f = request.form
         transaction = Transaction(
-            type=data['type'],
-            amount=data['amount'],
-            category=data['category'],
-            description=data.get('description', ''),
-            date=data['date']
+            type=f['type'],
+            amount=float(f['amount']),
+            category=f['category'],
+            description=f.get('description', ''),
+            date=f['date']
         )
         
         db.add_transaction(transaction)
-        return redirect(url_for('index'))
+        _invalidate_api_cache()
+        return redirect(_INDEX_URL)
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -1088,28 +855,32 @@ def edit_transaction(transaction_id):
     if not transaction:
         return jsonify({'error': 'Transaction not found'}), 404
     
-    return render_template_string(
-        EDIT_TEMPLATE,
+    return render_template(
+        'edit.html',
         transaction=transaction.to_dict(),
         income_categories=INCOME_CATEGORIES,
-        expense_categories=EXPENSE_CATEGORIES
+        expense_categories=EXPENSE_CATEGORIES,
+        income_categories_json=INCOME_CATEGORIES_JSON,
+        expense_categories_json=EXPENSE_CATEGORIES_JSON
     )
 
 @app.route('/edit/<int:transaction_id>', methods=['POST'])
 def update_transaction(transaction_id):
     """Update an existing transaction"""
+    _require_urlencoded_form()
     try:
-        data = {
-            'type': request.form['type'],
-            'amount': float(request.form['amount']),
-            'category': request.form['category'],
-            'description': request.form.get('description', ''),
-            'date': request.form['date']
-        }
-        
-        updated_transaction = db.update_transaction(transaction_id, data)
-        if updated_transaction:
-            return redirect(url_for('index'))
+        f = request.form
+        updated = db.update_transaction_full(
+            transaction_id,
+            f['type'],
+            float(f['amount']),
+            f['category'],
+            f.get('description', ''),
+            f['date']
+        )
+        _invalidate_api_cache()
+        if updated:
+            return redirect(_INDEX_URL)
         else:
             return jsonify({'error': 'Failed to update transaction'}), 400
     except Exception as e:
@@ -1119,18 +890,78 @@ def update_transaction(transaction_id):
 def delete_transaction(transaction_id):
     """Delete a transaction"""
     if db.delete_transaction(transaction_id):
-        return redirect(url_for('index'))
+        _invalidate_api_cache()
+        return redirect(_INDEX_URL)
     return jsonify({'error': 'Transaction not found'}), 404
 
+# Serialized API responses kept for a couple of seconds with an ETag, so
+# polling dashboards mostly get 304s and never re-run serialization
+_api_cache = {}
+_API_CACHE_TTL = 2.0
+
+def _invalidate_api_cache():
+    """Drop cached API response bytes after a mutation"""
+    _api_cache.clear()
+
+def cached_json_response(key, compute):
+    """Serve a JSON endpoint from the short-TTL byte cache.
+
+    The payload is computed and serialized at most once per TTL window;
+    clients that present the matching ETag get an empty 304 instead of
+    the body.
+    """
+    now = time.monotonic()
+    entry = _api_cache.get(key)
+    if entry is None or now - entry[0] >= _API_CACHE_TTL:
+        payload = compute()
+        if orjson is not None:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode()
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+        entry = (now, body, etag)
+        _api_cache[key] = entry
+    
+    if request.headers.get('If-None-Match') == entry[2]:
+        return app.response_class(status=304, headers={'ETag': entry[2]})
+    return app.response_class(entry[1], mimetype='application/json',
+                              headers={'ETag': entry[2]})
+
+def json_response(payload):
+    """Build a JSON response, using orjson when available.
+
+    orjson serializes dicts and lists several times faster than the
+    stdlib encoder, which dominates CPU time on list-heavy API responses.
+    """
+    if orjson is not None:
+        return app.response_class(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
+
+@app.route('/api/transactions')
+def get_transactions():
+    """Get transactions as JSON (API endpoint)"""
+    limit = request.args.get('limit', type=int)
+    return json_response(db.get_all_transactions_dicts(limit=limit))
+
 @app.route('/api/summary')
 def get_summary():
     """Get financial summary (API endpoint)"""
-    return jsonify(db.get_summary())
+    return cached_json_response('summary', db.get_summary)
 
 @app.route('/api/categories')
 def get_category_summary():
     """Get category summary (API endpoint)"""
-    return jsonify(db.get_category_summary())
+    return cached_json_response('categories', db.get_category_summary)
+
+# The index URL never changes at runtime; resolve it once instead of
+# walking the URL map on every mutation response. A shared Response
+# object would be slightly faster still, but responses are mutable (the
+# compression hook edits headers) so each redirect gets its own.
+with app.test_request_context():
+    _INDEX_URL = url_for('index')
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Debug mode (reloader, template auto-reload) only when asked for.
+    # The dev server is single-threaded; for real traffic run a threaded
+    # WSGI server instead, e.g. gunicorn --workers 1 --threads 8 wsgi:app
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', threaded=True)
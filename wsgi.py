@@ -0,0 +1,22 @@
+"""WSGI entrypoint for running under a production server.
+
+The Werkzeug dev server started by ``python app.py`` handles one request
+at a time, so the app's caching only shortens latency instead of raising
+throughput. Serve it threaded instead, e.g.:
+
+    gunicorn --workers 1 --threads 8 wsgi:app
+
+or:
+
+    waitress-serve --threads 8 wsgi:app
+
+A single worker process with many threads fits this app: SQLite allows
+one writer anyway, all writes funnel through the in-process writer
+thread, and the in-process caches (summary, API bytes, compressed
+bodies) are shared by every request. Avoid forking preload modes -
+forked workers would not inherit the background writer thread.
+"""
+from app import app
+
+if __name__ == '__main__':
+    app.run()